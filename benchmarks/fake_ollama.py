@@ -0,0 +1,182 @@
+"""
+Servidor que imita a API HTTP do Ollama, para medir o app sem modelos de verdade.
+A espera até o primeiro token, a taxa de tokens por segundo e o tamanho das respostas são configuráveis.
+"""
+import hashlib
+import json
+import struct
+import threading
+import time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class FakeOllamaServer:
+    """
+    Responde /api/chat (com e sem streaming), /api/generate, /api/embed, /api/tags, /api/ps e /api/version.
+    Uso:
+        with FakeOllamaServer(latency=0.2, tokens_per_second=40) as server:
+            os.environ["OLLAMA_HOST"] = server.url
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, latency=0.2, tokens_per_second=50.0, response_tokens=64,
+                 load_seconds=0.0, embedding_dim=64):
+        self.latency = latency
+        self.tokens_per_second = tokens_per_second
+        self.response_tokens = response_tokens
+        self.load_seconds = load_seconds
+        self.embedding_dim = embedding_dim
+        self.requests = Counter()  # rota -> pedidos recebidos
+        self._loaded = {}  # modelo -> instante em que foi carregado
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fake = self
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def load_model(self, model: str) -> float:
+        """Simula o carregamento do modelo na primeira chamada; retorna o tempo gasto (s)."""
+        with self._lock:
+            if model in self._loaded:
+                return 0.0
+            self._loaded[model] = time.time()
+        time.sleep(self.load_seconds)
+        return self.load_seconds
+
+    def unload_model(self, model: str):
+        with self._lock:
+            self._loaded.pop(model, None)
+
+    def loaded_models(self) -> list:
+        with self._lock:
+            return list(self._loaded)
+
+    def embedding(self, text: str) -> list:
+        """Vetor determinístico derivado do hash do texto."""
+        values, counter = [], 0
+        while len(values) < self.embedding_dim:
+            digest = hashlib.blake2b(f"{counter}:{text}".encode("utf-8"), digest_size=64).digest()
+            values.extend(value / 2**31 - 1 for value in struct.unpack("16I", digest))
+            counter += 1
+        return values[:self.embedding_dim]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    @property
+    def fake(self) -> FakeOllamaServer:
+        return self.server.fake
+
+    def _send_json(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.fake.requests[self.path] += 1
+        if self.path.startswith("/api/tags"):
+            self._send_json({"models": [{"name": model, "model": model} for model in self.fake.loaded_models()]})
+        elif self.path.startswith("/api/ps"):
+            self._send_json({"models": [{"name": model, "model": model, "size": 0, "size_vram": 0}
+                                        for model in self.fake.loaded_models()]})
+        elif self.path.startswith("/api/version"):
+            self._send_json({"version": "0.0.0-fake"})
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(length) or b"{}")
+        self.fake.requests[self.path] += 1
+        if self.path == "/api/chat":
+            self._chat(body)
+        elif self.path == "/api/generate":
+            # O app usa /api/generate sem prompt para carregar (keep_alive) ou descarregar (keep_alive=0) o modelo
+            if body.get("keep_alive") == 0:
+                self.fake.unload_model(body["model"])
+                load_seconds = 0.0
+            else:
+                load_seconds = self.fake.load_model(body["model"])
+            self._send_json({"model": body["model"], "response": "", "done": True, "load_duration": int(load_seconds * 1e9)})
+        elif self.path in ("/api/embed", "/api/embeddings"):
+            load_seconds = self.fake.load_model(body["model"])
+            texts = body.get("input", body.get("prompt", ""))
+            texts = [texts] if isinstance(texts, str) else texts
+            vectors = [self.fake.embedding(text) for text in texts]
+            if self.path == "/api/embeddings":
+                self._send_json({"embedding": vectors[0]})
+            else:
+                self._send_json({"model": body["model"], "embeddings": vectors, "load_duration": int(load_seconds * 1e9)})
+        else:
+            self.send_error(404)
+
+    def _chat(self, body):
+        model = body["model"]
+        load_seconds = self.fake.load_model(model)
+        prompt_tokens = sum(len(str(message.get("content", "")).split()) for message in body.get("messages", []))
+        tokens = [f"palavra{position} " for position in range(self.fake.response_tokens)]
+        interval = 1.0 / self.fake.tokens_per_second if self.fake.tokens_per_second > 0 else 0.0
+        started = time.time()
+        time.sleep(self.fake.latency)
+
+        def final_chunk(content):
+            eval_seconds = time.time() - started - self.fake.latency
+            return {
+                "model": model, "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "message": {"role": "assistant", "content": content}, "done": True, "done_reason": "stop",
+                "total_duration": int((time.time() - started + load_seconds) * 1e9),
+                "load_duration": int(load_seconds * 1e9),
+                "prompt_eval_count": prompt_tokens, "prompt_eval_duration": int(self.fake.latency * 1e9),
+                "eval_count": len(tokens), "eval_duration": int(max(eval_seconds, 0) * 1e9),
+            }
+
+        if not body.get("stream", True):
+            time.sleep(interval * len(tokens))
+            self._send_json(final_chunk("".join(tokens)))
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        try:
+            for token in tokens:
+                self._write_chunk({"model": model, "message": {"role": "assistant", "content": token}, "done": False})
+                time.sleep(interval)
+            self._write_chunk(final_chunk(""))
+            self.wfile.write(b"0\r\n\r\n")
+        except (BrokenPipeError, ConnectionResetError):
+            # O cliente parou de ler (ex.: botão "Parar")
+            pass
+
+    def _write_chunk(self, payload):
+        line = (json.dumps(payload) + "\n").encode("utf-8")
+        self.wfile.write(f"{len(line):X}\r\n".encode("ascii") + line + b"\r\n")
+        self.wfile.flush()
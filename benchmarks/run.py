@@ -0,0 +1,285 @@
+"""
+Mede como o EduSync Pro se comporta com o crescimento dos dados, sem Ollama nem navegador.
+
+    python benchmarks/run.py --sizes 100,1000,10000 --output resultados.json
+    python benchmarks/run.py --baseline resultados_antigos.json
+
+Para cada tamanho, gera um `user_data.json` sintético (tarefas, flashcards, anotações e conversas) e mede:
+  - pages: tempo de rerun de cada página, dirigindo o script com streamlit.testing (AppTest);
+  - persistence: custo de gravar (StateStore.stage/stage_records + flush, usados por save_state) e carregar (load_state);
+e, contra um servidor falso da API do Ollama (latência e tokens/s configuráveis):
+  - ai: vazão de respostas com várias sessões pedindo ao mesmo tempo.
+O resultado é gravado em JSON, para comparar versões com --baseline.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(BENCHMARKS_DIR)
+APP_PATH = os.path.join(REPO_ROOT, "app.py")
+sys.path[:0] = [REPO_ROOT, BENCHMARKS_DIR]
+
+from fake_ollama import FakeOllamaServer  # noqa: E402
+from synthetic_state import build_state, write_user_data  # noqa: E402
+
+RUN_DIR = tempfile.TemporaryDirectory(prefix="edusync-bench-")
+
+PAGES = {"Dashboard": "show_dashboard", "Tarefas": "show_tarefas", "Ferramentas": "show_ferramentas",
+         "Assistente IA": "show_ai_tools"}
+
+
+def summarize(samples: list) -> dict:
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "mean_s": statistics.fmean(ordered),
+        "p50_s": ordered[len(ordered) // 2],
+        "p95_s": ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+        "max_s": ordered[-1],
+    }
+
+
+def sizes_for(items: int) -> dict:
+    """Volume de cada tipo de dado para um tamanho da lista --sizes."""
+    return {"tasks": items, "flashcards": items, "note_paragraphs": max(1, items // 5),
+            "chat_messages": min(500, max(2, items // 20))}
+
+
+@contextmanager
+def working_directory(prefix: str):
+    """
+    O app grava seus bancos no diretório atual: cada medição usa uma pasta temporária nova.
+    As pastas só são apagadas no fim da execução, porque threads do app (ex.: embeddings) continuam usando-as.
+    """
+    previous = os.getcwd()
+    path = tempfile.mkdtemp(prefix=prefix, dir=RUN_DIR.name)
+    os.chdir(path)
+    try:
+        yield path
+    finally:
+        os.chdir(previous)
+
+
+def _timed(fn) -> float:
+    started = time.perf_counter()
+    fn()
+    return time.perf_counter() - started
+
+
+def _widget(widgets, label: str):
+    return next(widget for widget in widgets if widget.label == label)
+
+
+def bench_pages(items: int, runs: int, timeout: float) -> dict:
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    with working_directory("edusync-pages-") as path:
+        st.cache_resource.clear()
+        data_bytes = write_user_data(os.path.join(path, "user_data.json"), **sizes_for(items))
+        at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+        at.run()
+        _widget(at.text_input, "Para começar, qual é o seu nome de usuário?").input("bench")
+        _widget(at.text_input, "Escolha uma senha").input("bench")
+        _widget(at.text_input, "Confirme a senha").input("bench")
+        _widget(at.button, "Salvar e Iniciar Jornada").click()
+        # Cria a conta, importa o user_data.json e roda o primeiro carregamento do estado
+        first_load = _timed(at.run)
+        if at.exception:
+            raise RuntimeError(f"O app falhou ao entrar: {at.exception}")
+
+        results = {"data_bytes": data_bytes, "login_and_first_load_s": first_load, "pages": {}}
+        for page, function_name in PAGES.items():
+            switch = _timed(lambda: at.sidebar.radio[0].set_value(page).run())
+            samples = [_timed(at.run) for _ in range(runs)]
+            if at.exception:
+                raise RuntimeError(f"A página {page} falhou: {at.exception}")
+            results["pages"][function_name] = {"switch_s": switch, **summarize(samples)}
+        store = at.session_state["state_store"]
+        store.flush()
+        return results
+
+
+def bench_persistence(app, items: int, runs: int) -> dict:
+    with working_directory("edusync-persistence-") as path:
+        repository = app.SQLiteStateRepository(os.path.join(path, "bench.db"))
+        user_id = repository.create_user("bench", "bench")
+        state = build_state(**sizes_for(items))
+        state_bytes = len(json.dumps(state, ensure_ascii=False).encode("utf-8"))
+        store = app.StateStore(repository, user_id)
+        documents = {key: value for key, value in state.items() if key not in app.RECORD_KEYS}
+
+        def save(records=None):
+            # Como save_state: as chaves comuns são comparadas por hash e, das coleções, vão só os registros alterados
+            store.stage(documents)
+            for key, items in (records or {}).items():
+                store.stage_records(key, items)
+            store.flush()
+
+        first_save = _timed(lambda: (store.stage(state), store.flush()))
+        # Nada mudou: só os hashes das chaves comuns são recalculados
+        unchanged = [_timed(save) for _ in range(runs)]
+        # Uma tarefa alterada: só a linha dela vai para o banco
+        task_ids = list(state["tasks"])
+        changed = []
+        for position in range(runs):
+            task = state["tasks"][task_ids[position % len(task_ids)]]
+            task["title"] += "!"
+            changed.append(_timed(lambda: save({"tasks": {task["id"]: task}})))
+        loads = [_timed(lambda: app.StateStore(repository, user_id).load()) for _ in range(runs)]
+
+        search_index = app.SearchIndex(repository, user_id)
+        texts = {key: {item_id: json.dumps(item, ensure_ascii=False) for item_id, item in value.items()}
+                 if key in app.RECORD_KEYS else json.dumps(value, ensure_ascii=False)
+                 for key, value in state.items() if app.is_searchable_key(key)}
+        search_full = _timed(lambda: search_index.apply_changes(texts))
+        card = next(iter(state["flashcards"].values()))
+        card["verso"] += " revisado"
+        search_incremental = _timed(lambda: search_index.apply_changes(
+            {"flashcards": {card["id"]: json.dumps(card, ensure_ascii=False)}}, complete=False))
+        queries = [_timed(lambda: search_index.search("revisao funcao deriv")) for _ in range(runs)]
+        store.clear()
+        return {
+            "state_bytes": state_bytes,
+            "first_save_s": first_save,
+            "save_unchanged": summarize(unchanged),
+            "save_one_task_changed": summarize(changed),
+            "load": summarize(loads),
+            "search_index_full_s": search_full,
+            "search_index_one_change_s": search_incremental,
+            "search_query": summarize(queries),
+        }
+
+
+def bench_ai(app, server: FakeOllamaServer, sessions: int, requests_per_session: int, models: list) -> dict:
+    """Cada sessão faz seus pedidos em sequência, em streaming e sem cache, como no chat do app."""
+    def session(number):
+        model = models[number % len(models)]
+        samples = []
+        for position in range(requests_per_session):
+            started = time.perf_counter()
+            first_token = None
+            for _ in app.stream_local_ai_response(f"Sessão {number}, pergunta {position}", model=model, use_cache=False):
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+            samples.append((first_token, time.perf_counter() - started))
+        return samples
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        samples = [sample for result in pool.map(session, range(sessions)) for sample in result]
+    wall = time.perf_counter() - started
+    completed = [sample for sample in samples if sample[0] is not None]
+    return {
+        "sessions": sessions,
+        "requests": len(samples),
+        "failed": len(samples) - len(completed),
+        "wall_s": wall,
+        "requests_per_s": len(completed) / wall,
+        "tokens_per_s": len(completed) * server.response_tokens / wall,
+        "time_to_first_token": summarize([first for first, _ in completed]) if completed else None,
+        "response_time": summarize([total for _, total in completed]) if completed else None,
+        "scheduler": app.get_ollama_scheduler().metrics(),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=REPO_ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "desconhecida"
+
+
+def flatten(data, prefix="") -> dict:
+    values = {}
+    for key, value in data.items():
+        name = f"{prefix}.{key}" if prefix else str(key)
+        if isinstance(value, dict):
+            values.update(flatten(value, name))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            values[name] = value
+    return values
+
+
+def compare(baseline: dict, current: dict):
+    """Mostra a variação das métricas em relação a uma execução anterior."""
+    old, new = flatten(baseline["results"]), flatten(current["results"])
+    print(f"\nComparação com {baseline['revision']} ({baseline['timestamp']}):")
+    for name in sorted(old.keys() & new.keys()):
+        if old[name] and not name.endswith(".runs"):
+            print(f"  {name:<70} {old[name]:>12.4f} -> {new[name]:>12.4f} ({(new[name] - old[name]) / old[name]:+.1%})")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="100,1000,10000", help="Quantidade de tarefas/flashcards de cada cenário.")
+    parser.add_argument("--runs", type=int, default=5, help="Repetições de cada medição.")
+    parser.add_argument("--sessions", type=int, default=4, help="Sessões pedindo respostas ao mesmo tempo.")
+    parser.add_argument("--requests", type=int, default=5, help="Pedidos por sessão no teste de IA.")
+    parser.add_argument("--latency", type=float, default=0.2, help="Segundos até o primeiro token no Ollama falso.")
+    parser.add_argument("--tokens-per-second", type=float, default=50.0, help="Velocidade de geração do Ollama falso.")
+    parser.add_argument("--response-tokens", type=int, default=64, help="Tokens em cada resposta do Ollama falso.")
+    parser.add_argument("--timeout", type=float, default=300.0, help="Tempo máximo de cada rerun do AppTest.")
+    parser.add_argument("--skip", default="", help="Medições a pular, separadas por vírgula: pages,persistence,ai.")
+    parser.add_argument("--output", default=None, help="Arquivo JSON do resultado (padrão: benchmark-<data>.json).")
+    parser.add_argument("--baseline", default=None, help="Resultado anterior para comparar.")
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    skip = {name.strip() for name in args.skip.split(",") if name.strip()}
+    server = FakeOllamaServer(latency=args.latency, tokens_per_second=args.tokens_per_second,
+                              response_tokens=args.response_tokens).start()
+    # O cliente do Ollama lê OLLAMA_HOST ao ser importado, então isso vem antes de importar o app
+    os.environ["OLLAMA_HOST"] = server.url
+
+    results = {"pages": {}, "persistence": {}}
+    try:
+        for items in sizes:
+            if "pages" not in skip:
+                print(f"Páginas com {items} itens...", flush=True)
+                results["pages"][str(items)] = bench_pages(items, args.runs, args.timeout)
+        # Importar o app roda o script uma vez em modo "bare" (sem sessão), o que deixa o estado de layout
+        # do Streamlit inconsistente para o AppTest; por isso vem depois das medições de páginas
+        with working_directory("edusync-import-"):
+            import app
+        for items in sizes:
+            if "persistence" not in skip:
+                print(f"Persistência com {items} itens...", flush=True)
+                results["persistence"][str(items)] = bench_persistence(app, items, args.runs)
+        if "ai" not in skip:
+            print(f"IA com {args.sessions} sessões...", flush=True)
+            with working_directory("edusync-ai-"):
+                results["ai"] = bench_ai(app, server, args.sessions, args.requests, sorted(set(app.AI_MODES.values())))
+    finally:
+        server.stop()
+
+    report = {
+        "revision": git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "results": results,
+    }
+    output = args.output or f"benchmark-{datetime.now():%Y%m%d-%H%M%S}.json"
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"Resultado gravado em {output}")
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
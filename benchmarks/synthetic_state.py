@@ -0,0 +1,74 @@
+"""
+Gera estados de usuário sintéticos (tarefas, flashcards, anotações e conversas) no formato atual do app.
+O arquivo `user_data.json` gerado é importado pela primeira conta criada, como os dados das versões antigas.
+"""
+import json
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+WORDS = (
+    "estudo revisão função derivada integral matriz vetor célula mitocôndria fotossíntese revolução império "
+    "república gramática sintaxe verbo átomo molécula energia força velocidade equação gráfico teorema "
+    "história geografia clima relevo população economia literatura poesia romance algoritmo variável"
+).split()
+TASK_STATUSES = ("A Fazer", "Fazendo", "Feito")
+AI_MODES = ("✍️ Resumir texto", "❓ Responder perguntas", "🧑‍🏫 Explicar passo a passo", "⚡ Responder rápido (leve)")
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize() + "."
+
+
+def _item_id() -> str:
+    return uuid.uuid4().hex[:12]
+
+
+def build_state(tasks: int = 10_000, flashcards: int = 10_000, note_paragraphs: int = 2_000,
+                chat_messages: int = 200, seed: int = 42) -> dict:
+    """Estado de um usuário com o volume de dados informado."""
+    rng = random.Random(seed)
+    now = time.time()
+    day = 24 * 3600
+    task_items = {}
+    for _ in range(tasks):
+        task_id = _item_id()
+        status = rng.choice(TASK_STATUSES)
+        created = now - rng.uniform(0, 60 * day)
+        completed = min(now, created + rng.uniform(0, 5 * day)) if status == "Feito" else None
+        task_items[task_id] = {
+            "id": task_id, "title": _sentence(rng, rng.randint(3, 8)), "status": status,
+            "created_at": created, "updated_at": completed or created, "completed_at": completed,
+            "archived": bool(completed and completed < now - 7 * day),
+        }
+    cards = {}
+    for _ in range(flashcards):
+        card_id = _item_id()
+        cards[card_id] = {
+            "id": card_id, "frente": _sentence(rng, rng.randint(3, 10)), "verso": _sentence(rng, rng.randint(5, 30)),
+            "created_at": now - rng.uniform(0, 90 * day),
+            "due": (date.today() + timedelta(days=rng.randint(-10, 30))).isoformat(),
+            "interval": rng.randint(0, 30), "repetitions": rng.randint(0, 6), "ease": round(rng.uniform(1.3, 2.8), 2),
+        }
+    notes = "\n\n".join(" ".join(_sentence(rng, rng.randint(6, 16)) for _ in range(rng.randint(2, 6)))
+                        for _ in range(note_paragraphs))
+    state = {
+        "user_name": "Benchmark", "user_xp": 0, "user_level": 0,
+        "unlocked_achievements": [], "achievement_counters": {},
+        "tasks": task_items, "calendar_events": [], "flashcards": cards, "notes": notes,
+    }
+    for mode in AI_MODES:
+        state[f"chat_history_{mode}"] = [
+            {"role": "user" if position % 2 == 0 else "assistant", "content": _sentence(rng, rng.randint(8, 60))}
+            for position in range(chat_messages)
+        ]
+    return state
+
+
+def write_user_data(path: str, **sizes) -> int:
+    """Grava um `user_data.json` sintético e retorna seu tamanho em bytes."""
+    text = json.dumps(build_state(**sizes), ensure_ascii=False)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+    return len(text.encode("utf-8"))